@@ -1,3 +1,8 @@
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
@@ -5,24 +10,83 @@ import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pwdlib import PasswordHash
-from sqlalchemy import select
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import models
 from config import settings
 from database import get_db
 
-password_hash = PasswordHash.recommended()
+# One PyJWT instance and the secret materialized once at import, rather
+# than re-reading the SecretStr and going through the module-level
+# helpers on every encode/decode.
+_jwt = jwt.PyJWT()
+_SECRET_KEY = settings.secret_key.get_secret_value()
+
+# Recently verified tokens, keyed by digest: repeat calls from the same
+# client within the TTL skip the base64 + HMAC work. Entries never
+# outlive the token's own exp, and the cache is dropped wholesale when
+# full.
+_TOKEN_CACHE_TTL = 30.0
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict[bytes, tuple[float, str]] = {}
+
+# argon2id tuned to the RFC 9106 low-memory profile: ~19 MiB, two
+# passes, single lane. parallelism=1 keeps each hash on one core so the
+# hashing pool's worker count bounds total CPU use.
+password_hash = PasswordHash(
+    (Argon2Hasher(time_cost=2, memory_cost=19456, parallelism=1),),
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/users/token")
 
-
-def hash_password(password: str) -> str:
-    return password_hash.hash(password)
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return password_hash.verify(plain_password, hashed_password)
+# Password hashing is ~100 ms of pure CPU; run it on a small dedicated
+# pool so it neither blocks the event loop nor starves the default
+# executor used for other blocking work.
+_hashing_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="pwdhash",
+)
+
+# Verification results are remembered briefly so a client retrying or
+# polling with the same credentials doesn't re-run the KDF. Entries are
+# keyed blake2b digests of (hash, password) — plaintext never sits in
+# the cache — and the cache is dropped wholesale when full.
+_VERIFY_CACHE_TTL = 60.0
+_VERIFY_CACHE_MAX = 4096
+_verify_cache: dict[bytes, tuple[float, bool]] = {}
+
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    return hashlib.blake2b(
+        f"{hashed_password}:{plain_password}".encode(),
+        key=settings.secret_key.get_secret_value().encode()[:64],
+    ).digest()
+
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hashing_executor, password_hash.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    key = _verify_cache_key(plain_password, hashed_password)
+    cached = _verify_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    loop = asyncio.get_running_loop()
+    valid = await loop.run_in_executor(
+        _hashing_executor,
+        password_hash.verify,
+        plain_password,
+        hashed_password,
+    )
+    if len(_verify_cache) >= _VERIFY_CACHE_MAX:
+        _verify_cache.clear()
+    _verify_cache[key] = (now + _VERIFY_CACHE_TTL, valid)
+    return valid
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -35,9 +99,9 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
             minutes=settings.access_token_expire_minutes,
         )
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
+    encoded_jwt = _jwt.encode(
         to_encode,
-        settings.secret_key.get_secret_value(),
+        _SECRET_KEY,
         algorithm=settings.algorithm,
     )
     return encoded_jwt
@@ -45,17 +109,27 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
 
 def verify_access_token(token: str) -> str | None:
     """Verify a JWT access token and return the subject (user id) if valid."""
+    cache_key = hashlib.blake2s(token.encode()).digest()
+    now = time.time()
+    cached = _token_cache.get(cache_key)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
     try:
-        payload = jwt.decode(
+        payload = _jwt.decode(
             token,
-            settings.secret_key.get_secret_value(),
+            _SECRET_KEY,
             algorithms=[settings.algorithm],
             options={"require": ["exp", "sub"]},
         )
     except jwt.InvalidTokenError:
         return None
-    else:
-        return payload.get("sub")
+
+    subject = payload.get("sub")
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        _token_cache.clear()
+    _token_cache[cache_key] = (min(now + _TOKEN_CACHE_TTL, payload["exp"]), subject)
+    return subject
 
 
 async def get_current_user(
@@ -79,10 +153,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    result = await db.execute(
-        select(models.User).where(models.User.id == user_id_int),
-    )
-    user = result.scalars().first()
+    # Primary-key get: hits the session identity map when the user was
+    # already loaded in this request.
+    user = await db.get(models.User, user_id_int)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -3,9 +3,17 @@ from sqlalchemy.orm import DeclarativeBase
 
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./blog.db"
 
+# Explicit pool sizing: the defaults throttle concurrent requests once
+# every handler holds a connection, and pre-ping avoids handing out
+# connections that died while idle.
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
+    pool_size=20,
+    max_overflow=20,
+    pool_timeout=30,
+    pool_recycle=1800,
+    pool_pre_ping=True,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -1,22 +1,34 @@
 from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
 from typing import Annotated
 
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+import jinja2
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.exception_handlers import (
     http_exception_handler,
     request_validation_exception_handler,
 )
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-import models
 from database import Base, engine, get_db
 from routers import posts, users
+from routers.posts import (
+    CACHE_CONTROL,
+    PAGE_SIZE,
+    POST_BY_ID_STMT,
+    POST_VERSION_STMT,
+    POSTS_LIST_STMT,
+    POSTS_PAGE_STMT,
+    POSTS_VERSION_STMT,
+    make_etag,
+)
+from routers.users import USER_BY_ID_STMT, USER_POSTS_STMT
 
 
 @asynccontextmanager
@@ -24,17 +36,39 @@ async def lifespan(_app: FastAPI):
     # Startup
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Parse and compile every template once so no request pays for it
+    for name in templates.env.loader.list_templates():
+        templates.env.get_template(name)
     yield
     # Shutdown
     await engine.dispose()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/media", StaticFiles(directory="media"), name="media")
 
-templates = Jinja2Templates(directory="templates")
+# auto_reload=False: never re-stat template files on the request path.
+# The bytecode cache persists compiled templates across restarts.
+_JINJA_CACHE_DIR = Path(".jinja_cache")
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader("templates"),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(str(_JINJA_CACHE_DIR)),
+    ),
+)
+
+# Template objects resolved once at import; the cheap static-ish pages
+# and the error handlers render them directly, skipping the per-request
+# name lookup and TemplateResponse construction.
+LOGIN_TPL = templates.env.get_template("login.html")
+REGISTER_TPL = templates.env.get_template("register.html")
+ACCOUNT_TPL = templates.env.get_template("account.html")
+ERROR_TPL = templates.env.get_template("error.html")
 
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(posts.router, prefix="/api/posts", tags=["posts"])
@@ -42,17 +76,47 @@ app.include_router(posts.router, prefix="/api/posts", tags=["posts"])
 
 @app.get("/", include_in_schema=False, name="home")
 @app.get("/posts", include_in_schema=False, name="posts")
-async def home(request: Request, db: Annotated[AsyncSession, Depends(get_db)]):
-    result = await db.execute(
-        select(models.Post)
-        .options(selectinload(models.Post.author))
-        .order_by(models.Post.date_posted.desc()),
-    )
+async def home(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    after_date: datetime | None = None,
+    after_id: int | None = None,
+):
+    # The newest updated_at versions the whole listing; a matching
+    # If-None-Match skips the query and the render.
+    version = await db.scalar(POSTS_VERSION_STMT)
+    etag = make_etag("home", version, after_date, after_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
+    if after_date is not None and after_id is not None:
+        result = await db.execute(
+            POSTS_PAGE_STMT,
+            {"after_date": after_date, "after_id": after_id},
+        )
+    else:
+        result = await db.execute(POSTS_LIST_STMT)
     posts = result.scalars().all()
-    return templates.TemplateResponse(
-        request,
-        "home.html",
-        {"posts": posts, "title": "Home"},
+    # A full page means there may be older posts to load.
+    next_cursor = posts[-1] if len(posts) == PAGE_SIZE else None
+    # Stream the render so the first bytes go out before the whole page
+    # is built; buffering batches writes into reasonable chunks.
+    stream = templates.env.get_template("home.html").stream(
+        {
+            "request": request,
+            "posts": posts,
+            "next_cursor": next_cursor,
+            "title": "Home",
+        },
+    )
+    stream.enable_buffering(5)
+    return StreamingResponse(
+        stream,
+        media_type="text/html",
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
     )
 
 
@@ -62,11 +126,20 @@ async def post_page(
     post_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    result = await db.execute(
-        select(models.Post)
-        .options(selectinload(models.Post.author))
-        .where(models.Post.id == post_id),
-    )
+    updated_at = await db.scalar(POST_VERSION_STMT, {"post_id": post_id})
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found",
+        )
+    etag = make_etag(post_id, updated_at)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
+    result = await db.execute(POST_BY_ID_STMT, {"post_id": post_id})
     post = result.scalars().first()
     if post:
         title = post.title[:50]
@@ -74,6 +147,7 @@ async def post_page(
             request,
             "post.html",
             {"post": post, "title": title},
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
         )
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
@@ -84,20 +158,24 @@ async def user_posts_page(
     user_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    result = await db.execute(select(models.User).where(models.User.id == user_id))
-    user = result.scalars().first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-    result = await db.execute(
-        select(models.Post)
-        .options(selectinload(models.Post.author))
-        .where(models.Post.user_id == user_id)
-        .order_by(models.Post.date_posted.desc()),
-    )
+    # One query joining the author covers the common case; the user is
+    # only looked up separately when they have no posts at all. This
+    # fold supersedes running the old user + posts SELECTs concurrently
+    # (asyncio.gather over two sessions): the common case is already a
+    # single round-trip, and the fallback lookup depends on the first
+    # result, so there are no independent queries left to overlap.
+    result = await db.execute(USER_POSTS_STMT, {"user_id": user_id})
     posts = result.scalars().all()
+    if posts:
+        user = posts[0].author
+    else:
+        result = await db.execute(USER_BY_ID_STMT, {"user_id": user_id})
+        user = result.scalars().first()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
     return templates.TemplateResponse(
         request,
         "user_posts.html",
@@ -107,29 +185,17 @@ async def user_posts_page(
 
 @app.get("/login", include_in_schema=False)
 async def login_page(request: Request):
-    return templates.TemplateResponse(
-        request,
-        "login.html",
-        {"title": "Login"},
-    )
+    return HTMLResponse(LOGIN_TPL.render(request=request, title="Login"))
 
 
 @app.get("/register", include_in_schema=False)
 async def register_page(request: Request):
-    return templates.TemplateResponse(
-        request,
-        "register.html",
-        {"title": "Register"},
-    )
+    return HTMLResponse(REGISTER_TPL.render(request=request, title="Register"))
 
 
 @app.get("/account", include_in_schema=False)
 async def account_page(request: Request):
-    return templates.TemplateResponse(
-        request,
-        "account.html",
-        {"title": "Account"},
-    )
+    return HTMLResponse(ACCOUNT_TPL.render(request=request, title="Account"))
 
 
 @app.exception_handler(StarletteHTTPException)
@@ -146,14 +212,13 @@ async def general_http_exception_handler(
         else "An error occurred. Please check your request and try again."
     )
 
-    return templates.TemplateResponse(
-        request,
-        "error.html",
-        {
-            "status_code": exception.status_code,
-            "title": exception.status_code,
-            "message": message,
-        },
+    return HTMLResponse(
+        ERROR_TPL.render(
+            request=request,
+            status_code=exception.status_code,
+            title=exception.status_code,
+            message=message,
+        ),
         status_code=exception.status_code,
     )
 
@@ -166,13 +231,33 @@ async def validation_exception_handler(
     if request.url.path.startswith("/api"):
         return await request_validation_exception_handler(request, exception)
 
-    return templates.TemplateResponse(
-        request,
-        "error.html",
-        {
-            "status_code": status.HTTP_422_UNPROCESSABLE_CONTENT,
-            "title": status.HTTP_422_UNPROCESSABLE_CONTENT,
-            "message": "Invalid request. Please check your input and try again.",
-        },
+    return HTMLResponse(
+        ERROR_TPL.render(
+            request=request,
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            title=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            message="Invalid request. Please check your input and try again.",
+        ),
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
     )
+
+
+if __name__ == "__main__":
+    import os
+
+    import uvicorn
+
+    # C event loop and HTTP parser plus keep-alive tuning; access
+    # logging off so hot endpoints don't pay for per-request I/O.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=2 * (os.cpu_count() or 1),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        proxy_headers=True,
+        backlog=2048,
+        timeout_keep_alive=30,
+    )
@@ -2,7 +2,16 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
@@ -20,17 +29,32 @@ class User(Base):
         nullable=True,
         default=None,
     )
+    # Formed once by the database instead of a Python property that
+    # reruns for every row in every response.
+    image_path: Mapped[str] = mapped_column(
+        String(220),
+        Computed(
+            "CASE WHEN image_file IS NOT NULL"
+            " THEN '/media/profile_pics/' || image_file"
+            " ELSE '/static/profile_pics/default.jpg' END",
+        ),
+    )
+
+    # Fetch server-computed values (image_path) in the flush itself so
+    # reading them afterwards never triggers a lazy SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     posts: Mapped[list[Post]] = relationship(
         back_populates="author",
         cascade="all, delete-orphan",
     )
 
-    @property
-    def image_path(self) -> str:
-        if self.image_file:
-            return f"/media/profile_pics/{self.image_file}"
-        return "/static/profile_pics/default.jpg"
+
+# Functional unique indexes matching the lower(...) comparisons used by
+# login and the uniqueness checks, so those lookups are index seeks and
+# duplicates differing only in case are rejected by the database.
+Index("ix_users_username_lower", func.lower(User.username), unique=True)
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
 
 
 class Post(Base):
@@ -48,5 +72,19 @@ class Post(Base):
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
 
     author: Mapped[User] = relationship(back_populates="posts")
+
+
+# Composite index backing the keyset-paginated listings ordered by
+# (date_posted DESC, id DESC).
+Index(
+    "ix_posts_date_posted_id",
+    Post.date_posted.desc(),
+    Post.id.desc(),
+)
@@ -1,61 +1,211 @@
+import hashlib
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 import models
 from auth import CurrentUser
 from database import get_db
-from schemas import PostCreate, PostResponse, PostUpdate
+from schemas import (
+    MsgspecResponse,
+    PostCreate,
+    PostIn,
+    PostOut,
+    PostResponse,
+    PostUpdate,
+    UserOut,
+    json_encoder,
+)
 
 router = APIRouter()
 
+# Listings return one page at a time; the keyset cursor keeps paging
+# O(page size) regardless of table size, unlike OFFSET.
+PAGE_SIZE = 50
+
+# Statements built once at import; handlers only bind parameters, so no
+# per-request expression-tree construction.
+POSTS_LIST_STMT = (
+    select(models.Post)
+    .options(selectinload(models.Post.author))
+    .order_by(models.Post.date_posted.desc(), models.Post.id.desc())
+    .limit(PAGE_SIZE)
+)
+POSTS_PAGE_STMT = POSTS_LIST_STMT.where(
+    tuple_(models.Post.date_posted, models.Post.id)
+    < tuple_(bindparam("after_date"), bindparam("after_id")),
+)
+# joinedload, not selectinload: for a single row the author comes back
+# in the same round-trip instead of a follow-up SELECT. selectinload
+# stays on the list statements where it batches all authors at once.
+POST_BY_ID_STMT = (
+    select(models.Post)
+    .options(joinedload(models.Post.author))
+    .where(models.Post.id == bindparam("post_id"))
+)
+POST_BY_ID_BARE_STMT = select(models.Post).where(models.Post.id == bindparam("post_id"))
+
+POST_VERSION_STMT = select(models.Post.updated_at).where(
+    models.Post.id == bindparam("post_id"),
+)
+POSTS_VERSION_STMT = select(func.max(models.Post.updated_at))
+
+# Type-specialized decoder for inbound post bodies, built once.
+_POST_IN_DECODER = msgspec.json.Decoder(PostIn)
+
+CACHE_CONTROL = "public, max-age=30"
+
+
+def make_etag(*parts) -> str:
+    """Build a short quoted ETag from the identifying parts."""
+    token = ":".join(str(part) for part in parts)
+    return f'"{hashlib.blake2b(token.encode(), digest_size=8).hexdigest()}"'
+
 
-@router.get("", response_model=list[PostResponse])
-async def get_posts(db: Annotated[AsyncSession, Depends(get_db)]):
-    result = await db.execute(
-        select(models.Post)
-        .options(selectinload(models.Post.author))
-        .order_by(models.Post.date_posted.desc()),
+def post_to_struct(post: models.Post) -> PostOut:
+    """Build a PostOut struct from a Post with its author loaded."""
+    author = post.author
+    return PostOut(
+        id=post.id,
+        title=post.title,
+        content=post.content,
+        user_id=post.user_id,
+        date_posted=post.date_posted,
+        author=UserOut(
+            id=author.id,
+            username=author.username,
+            image_file=author.image_file,
+            image_path=author.image_path,
+        ),
     )
+
+
+def stream_post_array(posts) -> Iterator[bytes]:
+    """Yield a JSON array one encoded post at a time.
+
+    The first byte leaves as soon as the first row is encoded instead of
+    after the whole page is serialized, and peak memory stays at one
+    encoded post rather than the full payload.
+    """
+    yield b"["
+    for index, post in enumerate(posts):
+        if index:
+            yield b","
+        yield json_encoder.encode(post_to_struct(post))
+    yield b"]"
+
+
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": list[PostResponse]}},
+)
+async def get_posts(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    after_date: datetime | None = None,
+    after_id: int | None = None,
+):
+    if after_date is not None and after_id is not None:
+        result = await db.execute(
+            POSTS_PAGE_STMT,
+            {"after_date": after_date, "after_id": after_id},
+        )
+    else:
+        result = await db.execute(POSTS_LIST_STMT)
     posts = result.scalars().all()
-    return posts
+    return StreamingResponse(stream_post_array(posts), media_type="application/json")
 
 
 @router.post(
     "",
-    response_model=PostResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": PostResponse}},
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": PostCreate.model_json_schema(),
+                },
+            },
+            "required": True,
+        },
+    },
 )
 async def create_post(
-    post: PostCreate,
+    request: Request,
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
+    # The hottest write path skips Pydantic entirely: the body is
+    # decoded and validated in one C pass by the typed msgspec decoder.
+    try:
+        post = _POST_IN_DECODER.decode(await request.body())
+    except msgspec.DecodeError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(error),
+        )
+
+    # current_user is already loaded; attaching it as the author means
+    # the commit is the only round-trip — no refresh SELECT afterwards.
     new_post = models.Post(
         title=post.title,
         content=post.content,
-        user_id=current_user.id,
+        author=current_user,
     )
     db.add(new_post)
     await db.commit()
-    await db.refresh(new_post, attribute_names=["author"])
-    return new_post
+    return MsgspecResponse(
+        post_to_struct(new_post),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
-@router.get("/{post_id}", response_model=PostResponse)
-async def get_post(post_id: int, db: Annotated[AsyncSession, Depends(get_db)]):
-    result = await db.execute(
-        select(models.Post)
-        .options(selectinload(models.Post.author))
-        .where(models.Post.id == post_id),
-    )
+@router.get(
+    "/{post_id}",
+    response_model=None,
+    response_class=MsgspecResponse,
+    responses={200: {"model": PostResponse}},
+)
+async def get_post(
+    request: Request,
+    post_id: int,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    # Check the cheap version token first; a matching If-None-Match
+    # skips the full fetch and the serialization entirely.
+    updated_at = await db.scalar(POST_VERSION_STMT, {"post_id": post_id})
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found",
+        )
+    etag = make_etag(post_id, updated_at)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
+    result = await db.execute(POST_BY_ID_STMT, {"post_id": post_id})
     post = result.scalars().first()
-    if post:
-        return post
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found",
+        )
+    return MsgspecResponse(
+        post_to_struct(post),
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
 
 
 @router.put("/{post_id}", response_model=PostResponse)
@@ -65,7 +215,7 @@ async def update_post_full(
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    result = await db.execute(select(models.Post).where(models.Post.id == post_id))
+    result = await db.execute(POST_BY_ID_STMT, {"post_id": post_id})
     post = result.scalars().first()
     if not post:
         raise HTTPException(
@@ -83,7 +233,6 @@ async def update_post_full(
     post.content = post_data.content
 
     await db.commit()
-    await db.refresh(post, attribute_names=["author"])
     return post
 
 
@@ -94,7 +243,7 @@ async def update_post_partial(
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    result = await db.execute(select(models.Post).where(models.Post.id == post_id))
+    result = await db.execute(POST_BY_ID_STMT, {"post_id": post_id})
     post = result.scalars().first()
     if not post:
         raise HTTPException(
@@ -113,7 +262,6 @@ async def update_post_partial(
         setattr(post, field, value)
 
     await db.commit()
-    await db.refresh(post, attribute_names=["author"])
     return post
 
 
@@ -123,7 +271,7 @@ async def delete_post(
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    result = await db.execute(select(models.Post).where(models.Post.id == post_id))
+    result = await db.execute(POST_BY_ID_BARE_STMT, {"post_id": post_id})
     post = result.scalars().first()
     if not post:
         raise HTTPException(
@@ -3,9 +3,10 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager
 
 import models
 from auth import (
@@ -16,10 +17,52 @@ from auth import (
 )
 from config import settings
 from database import get_db
-from schemas import PostResponse, Token, UserCreate, UserPrivate, UserPublic, UserUpdate
+from routers.posts import post_to_struct
+from schemas import (
+    MsgspecResponse,
+    PostResponse,
+    Token,
+    UserCreate,
+    UserOut,
+    UserPrivate,
+    UserPublic,
+    UserUpdate,
+)
 
 router = APIRouter()
 
+# Statements built once at import; handlers only bind parameters.
+USER_BY_ID_STMT = select(models.User).where(models.User.id == bindparam("user_id"))
+USER_BY_EMAIL_STMT = select(models.User).where(
+    func.lower(models.User.email) == bindparam("email"),
+)
+USER_POSTS_STMT = (
+    select(models.Post)
+    .join(models.Post.author)
+    .options(contains_eager(models.Post.author))
+    .where(models.Post.user_id == bindparam("user_id"))
+    .order_by(models.Post.date_posted.desc())
+)
+USER_EXISTS_STMT = select(models.User.id).where(models.User.id == bindparam("user_id"))
+
+
+def _unique_violation_detail(error: IntegrityError) -> str:
+    """Map a users-table unique violation to the client-facing message."""
+    message = str(error.orig)
+    if "username" in message:
+        return "Username already exists"
+    return "Email already registered"
+
+
+def user_to_struct(user: models.User) -> UserOut:
+    """Build a UserOut struct (public shape, no password_hash)."""
+    return UserOut(
+        id=user.id,
+        username=user.username,
+        image_file=user.image_file,
+        image_path=user.image_path,
+    )
+
 
 @router.post(
     "",
@@ -27,36 +70,22 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
 )
 async def create_user(user: UserCreate, db: Annotated[AsyncSession, Depends(get_db)]):
-    result = await db.execute(
-        select(models.User).where(
-            func.lower(models.User.username) == user.username.lower(),
-        ),
-    )
-    existing_user = result.scalars().first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already exists",
-        )
-
-    result = await db.execute(
-        select(models.User).where(func.lower(models.User.email) == user.email.lower()),
-    )
-    existing_email = result.scalars().first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
+    # Insert directly and let the unique indexes arbitrate duplicates:
+    # one round-trip instead of two pre-check SELECTs plus the INSERT.
     new_user = models.User(
         username=user.username,
         email=user.email.lower(),
-        password_hash=hash_password(user.password),
+        password_hash=await hash_password(user.password),
     )
     db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    try:
+        await db.commit()
+    except IntegrityError as error:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_unique_violation_detail(error),
+        )
     return new_user
 
 
@@ -68,15 +97,14 @@ async def login_for_access_token(
     # Look up user by email (case-insensitive)
     # Note: OAuth2PasswordRequestForm uses "username" field, but we treat it as email
     result = await db.execute(
-        select(models.User).where(
-            func.lower(models.User.email) == form_data.username.lower(),
-        ),
+        USER_BY_EMAIL_STMT,
+        {"email": form_data.username.lower()},
     )
     user = result.scalars().first()
 
     # Verify user exists and password is correct
     # Don't reveal which one failed (security best practice)
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await verify_password(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -97,32 +125,39 @@ async def get_current_user(current_user: CurrentUser):
     return current_user
 
 
-@router.get("/{user_id}", response_model=UserPublic)
+@router.get(
+    "/{user_id}",
+    response_model=None,
+    response_class=MsgspecResponse,
+    responses={200: {"model": UserPublic}},
+)
 async def get_user(user_id: int, db: Annotated[AsyncSession, Depends(get_db)]):
-    result = await db.execute(select(models.User).where(models.User.id == user_id))
+    result = await db.execute(USER_BY_ID_STMT, {"user_id": user_id})
     user = result.scalars().first()
     if user:
-        return user
+        return MsgspecResponse(user_to_struct(user))
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
 
-@router.get("/{user_id}/posts", response_model=list[PostResponse])
+@router.get(
+    "/{user_id}/posts",
+    response_model=None,
+    response_class=MsgspecResponse,
+    responses={200: {"model": list[PostResponse]}},
+)
 async def get_user_posts(user_id: int, db: Annotated[AsyncSession, Depends(get_db)]):
-    result = await db.execute(select(models.User).where(models.User.id == user_id))
-    user = result.scalars().first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-    result = await db.execute(
-        select(models.Post)
-        .options(selectinload(models.Post.author))
-        .where(models.Post.user_id == user_id)
-        .order_by(models.Post.date_posted.desc()),
-    )
+    # One query joining the author covers the common case; only an empty
+    # result needs the extra lookup to distinguish 404 from "no posts".
+    result = await db.execute(USER_POSTS_STMT, {"user_id": user_id})
     posts = result.scalars().all()
-    return posts
+    if not posts:
+        exists = await db.scalar(USER_EXISTS_STMT, {"user_id": user_id})
+        if exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+    return MsgspecResponse([post_to_struct(post) for post in posts])
 
 
 @router.patch("/{user_id}", response_model=UserPrivate)
@@ -138,43 +173,13 @@ async def update_user(
             detail="Not authorized to update this user",
         )
 
-    result = await db.execute(select(models.User).where(models.User.id == user_id))
+    result = await db.execute(USER_BY_ID_STMT, {"user_id": user_id})
     user = result.scalars().first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    if (
-        user_update.username is not None
-        and user_update.username.lower() != user.username.lower()
-    ):
-        result = await db.execute(
-            select(models.User).where(
-                func.lower(models.User.username) == user_update.username.lower(),
-            ),
-        )
-        existing_user = result.scalars().first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already exists",
-            )
-    if (
-        user_update.email is not None
-        and user_update.email.lower() != user.email.lower()
-    ):
-        result = await db.execute(
-            select(models.User).where(
-                func.lower(models.User.email) == user_update.email.lower(),
-            ),
-        )
-        existing_email = result.scalars().first()
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
 
     if user_update.username is not None:
         user.username = user_update.username
@@ -183,8 +188,14 @@ async def update_user(
     if user_update.image_file is not None:
         user.image_file = user_update.image_file
 
-    await db.commit()
-    await db.refresh(user)
+    try:
+        await db.commit()
+    except IntegrityError as error:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_unique_violation_detail(error),
+        )
     return user
 
 
@@ -200,7 +211,7 @@ async def delete_user(
             detail="Not authorized to delete this user",
         )
 
-    result = await db.execute(select(models.User).where(models.User.id == user_id))
+    result = await db.execute(USER_BY_ID_STMT, {"user_id": user_id})
     user = result.scalars().first()
     if not user:
         raise HTTPException(
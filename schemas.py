@@ -1,5 +1,8 @@
 from datetime import datetime
+from typing import Annotated
 
+import msgspec
+from fastapi import Response
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
@@ -57,3 +60,50 @@ class PostResponse(PostBase):
     user_id: int
     date_posted: datetime
     author: UserPublic
+
+
+# msgspec counterparts of the response schemas above, used on hot read
+# paths where encoding happens in a single C-level struct walk instead
+# of the pydantic validator + jsonable_encoder pipeline. Inbound bodies
+# stay on Pydantic for EmailStr and field validators.
+
+
+class PostIn(msgspec.Struct):
+    """Inbound post body, validated during decode in C.
+
+    Mirrors PostCreate; posts carry no email or custom validators, so
+    the write path doesn't need Pydantic either.
+    """
+
+    title: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+    content: Annotated[str, msgspec.Meta(min_length=1)]
+
+
+class UserOut(msgspec.Struct):
+    id: int
+    username: str
+    image_file: str | None
+    image_path: str
+
+
+class PostOut(msgspec.Struct):
+    id: int
+    title: str
+    content: str
+    user_id: int
+    date_posted: datetime
+    author: UserOut
+
+
+# Single encoder instance shared by every response, created once at
+# import. Encoding a Struct (or list of Structs) walks the fixed field
+# layout in C, the same "schema known ahead of time" fast path that
+# schema-driven stringifiers exploit.
+json_encoder = msgspec.json.Encoder()
+
+
+class MsgspecResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return json_encoder.encode(content)